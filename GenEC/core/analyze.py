@@ -4,6 +4,11 @@ import os
 import re
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 
 YES_INPUT = ['yes', 'y']
 NO_INPUT = ['no', 'n']
@@ -33,7 +38,7 @@ class TextFilterTypes(Enum):
 
 
 class InputManager:
-    PRESETS_DIR = os.path.join(os.path.dirname(__file__), '../presets')
+    PRESETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'presets'))
 
     def __init__(self, preset_param: str = None):
         self.preset_file, self.preset_name = self.parse_preset_param(preset_param) if preset_param else (None, None)
@@ -61,11 +66,11 @@ class InputManager:
 
     def load_presets_file(self):
         presets_file_path = os.path.join(self.PRESETS_DIR, self.preset_file) + '.yaml'
-        if not os.path.exists(presets_file_path):
-            raise FileNotFoundError(f'preset file {presets_file_path} not found.')
-
-        with open(presets_file_path, 'r') as file:
-            presets = yaml.safe_load(file)
+        try:
+            with open(presets_file_path, 'r') as file:
+                presets = yaml.load(file, Loader=SafeLoader)
+        except FileNotFoundError:
+            raise FileNotFoundError(f'preset file {presets_file_path} not found.') from None
 
         if not presets or len(presets) == 0:
             raise ValueError(f'presets file {presets_file_path} does not contain any presets')
@@ -205,8 +210,9 @@ class Extractor:
 
     def extract_text_from_clusters_by_regex(self, clusters):
         filtered_text = []
+        search = re.compile(self.config.get(ConfigOptions.TEXT_FILTER.value)).search
         for cluster in clusters:
-            search_result = re.search(self.config.get(ConfigOptions.TEXT_FILTER.value), cluster)
+            search_result = search(cluster)
             if search_result is not None:
                 filtered_text.append(search_result.group(1))
         return filtered_text
@@ -218,13 +224,15 @@ class Comparer:
         self.reference = reference
         self.source_counter = Counter(source)
         self.reference_counter = Counter(reference)
-        self.unique_elements = set(self.source_counter.keys()).union(self.reference_counter.keys())
+        self.unique_elements = self.source_counter.keys() | self.reference_counter.keys()
 
     def compare(self):
         differences = {}
+        source_count = self.source_counter.get
+        reference_count = self.reference_counter.get
         for element in self.unique_elements:
-            src_count = self.source_counter.get(element, 0)
-            ref_count = self.reference_counter.get(element, 0)
+            src_count = source_count(element, 0)
+            ref_count = reference_count(element, 0)
             differences[element] = {
                 'source': src_count,
                 'reference': ref_count,
@@ -26,10 +26,15 @@ def main():
     input_manager.set_config()
     extractor = analyze.Extractor(input_manager.config)
     print('Extracting data from source file...')
-    source_filtered_text = extractor.extract_from_data(source, analyze.Files.SOURCE)
+    source_filtered_text = extractor.extract_from_data(source, analyze.Files.SOURCE.value)
     print('Extracting complete.')
     print('Extracting data from reference file...')
-    ref_filtered_text = extractor.extract_from_data(ref, analyze.Files.REFERENCE)
+    # read_files returns the same object when both paths are the same file, comparing a file against itself
+    # yields the same extraction unless the source and reference slices differ
+    if source is ref and not input_manager.config.get(analyze.ConfigOptions.SHOULD_SLICE_CLUSTERS.value):
+        ref_filtered_text = source_filtered_text
+    else:
+        ref_filtered_text = extractor.extract_from_data(ref, analyze.Files.REFERENCE.value)
     print('Extracting complete.')
 
     comparer = analyze.Comparer(source_filtered_text, ref_filtered_text)
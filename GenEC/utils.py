@@ -1,11 +1,23 @@
+import os
 from prettytable import PrettyTable
 
 
 def read_files(file_paths):
-    files = []
-    for file in file_paths:
-        files.append(read_file(file))
-    return files
+    # paths pointing to the same file (e.g. comparing a file against itself) are only read once
+    file_ids = [get_file_id(file) for file in file_paths]
+    file_contents = {}
+    for file_id, file in zip(file_ids, file_paths):
+        if file_id not in file_contents:
+            file_contents[file_id] = read_file(file)
+    return [file_contents[file_id] for file_id in file_ids]
+
+
+def get_file_id(file):
+    # same identity os.path.samefile compares, so symlinks, hardlinks and path spellings all match
+    file_stat = os.stat(file)
+    if file_stat.st_ino == 0:  # some network shares and FUSE filesystems don't provide a unique inode
+        return os.path.abspath(file)
+    return file_stat.st_dev, file_stat.st_ino
 
 
 def read_file(file):
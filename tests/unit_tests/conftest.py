@@ -0,0 +1,20 @@
+import pytest
+
+
+@pytest.fixture
+def same_file_path(tmp_path):
+    """Return a factory building another path that refers to the given file."""
+    def create_same_file_path(file, kind):
+        if kind == 'same_path':
+            return file
+        if kind == 'other_spelling':
+            return file.parent / '.' / file.name
+        link = tmp_path / f'{kind}_{file.name}'
+        if kind == 'symlink':
+            link.symlink_to(file)
+        elif kind == 'hardlink':
+            link.hardlink_to(file)
+        else:
+            raise ValueError(f'unknown same file kind: {kind}')
+        return link
+    return create_same_file_path
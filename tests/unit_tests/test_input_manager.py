@@ -100,16 +100,16 @@ def test_load_from_multiple_presets_existing_preset_name(mock_load_presets_file,
     assert result == MULTIPLE_PRESETS_DATA[preset_name]
 
 
-@patch('os.path.exists', return_value=False)
-def test_load_presets_file_file_not_found(mock_exists, im_instance):
+@patch('builtins.open', side_effect=FileNotFoundError)
+def test_load_presets_file_file_not_found(mock_open_file, im_instance):
     im_instance.preset_file = 'mock_file'
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match='preset file .*mock_file.yaml not found.') as exc_info:
         im_instance.load_presets_file()
+    assert exc_info.value.__suppress_context__
 
 
-@patch('os.path.exists', return_value=True)
 @patch('builtins.open', new_callable=mock_open, read_data='')
-def test_load_presets_file_empty_file(mock_open_file, mock_exists, im_instance):
+def test_load_presets_file_empty_file(mock_open_file, im_instance):
     im_instance.preset_file = 'mock_file'
     with pytest.raises(ValueError):
         im_instance.load_presets_file()
@@ -119,11 +119,10 @@ def test_load_presets_file_empty_file(mock_open_file, mock_exists, im_instance):
     (SINGLE_PRESET_DATA),
     (MULTIPLE_PRESETS_DATA)
 ])
-@patch('os.path.exists', return_value=True)
 @patch('builtins.open', new_callable=mock_open)
-@patch('yaml.safe_load')
-def test_load_presets_file_valid_file(mock_safe_load, mock_open_file, mock_exists, im_instance, preset_data):
-    mock_safe_load.return_value = preset_data
+@patch('yaml.load')
+def test_load_presets_file_valid_file(mock_load, mock_open_file, im_instance, preset_data):
+    mock_load.return_value = preset_data
     im_instance.preset_file = 'mock_file'
     result = im_instance.load_presets_file()
     assert result == preset_data
@@ -0,0 +1,84 @@
+import importlib
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+GENEC_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'GenEC')
+
+REGEX_CONFIG = {
+    'cluster_filter': '\n',
+    'text_filter_type': 'Regex',
+    'text_filter': r'(\d)',
+    'should_slice_clusters': False
+}
+
+
+@pytest.fixture
+def genec_main(monkeypatch):
+    # main.py imports its siblings the way it is run as a script: `import utils` and `from core import analyze`
+    monkeypatch.syspath_prepend(GENEC_DIR)
+    return importlib.import_module('main')
+
+
+def run_main(genec_main, source, reference, config):
+    with patch.object(sys, 'argv', ['main.py', '--source', str(source), '--reference', str(reference)]), \
+            patch.object(genec_main.analyze, 'InputManager') as mock_input_manager, \
+            patch.object(genec_main.analyze.Extractor, 'extract_from_data', autospec=True,
+                         side_effect=genec_main.analyze.Extractor.extract_from_data) as mock_extract, \
+            patch.object(genec_main.utils, 'create_ascii_table', return_value='') as mock_create_table:
+        mock_input_manager.return_value.config = dict(config)
+        genec_main.main()
+    return mock_extract, mock_create_table.call_args[0][0]
+
+
+@pytest.mark.parametrize('reference_kind', ['same_path', 'other_spelling', 'symlink', 'hardlink'])
+def test_main_same_file_extracts_once(genec_main, tmp_path, same_file_path, reference_kind):
+    source = tmp_path / 'source.txt'
+    source.write_text('a 1\nb 2\nc 1')
+    reference = same_file_path(source, reference_kind)
+    mock_extract, differences = run_main(genec_main, source, reference, REGEX_CONFIG)
+    assert mock_extract.call_count == 1
+    assert differences == {
+        '1': {'source': 2, 'reference': 2, 'difference': 0},
+        '2': {'source': 1, 'reference': 1, 'difference': 0}
+    }
+
+
+def test_main_different_files_extracts_both(genec_main, tmp_path):
+    source = tmp_path / 'source.txt'
+    source.write_text('a 1\nb 2')
+    reference = tmp_path / 'reference.txt'
+    reference.write_text('a 1\nb 3')
+    mock_extract, differences = run_main(genec_main, source, reference, REGEX_CONFIG)
+    assert mock_extract.call_count == 2
+    assert differences == {
+        '1': {'source': 1, 'reference': 1, 'difference': 0},
+        '2': {'source': 1, 'reference': 0, 'difference': 1},
+        '3': {'source': 0, 'reference': 1, 'difference': -1}
+    }
+
+
+def test_main_same_file_with_slicing_extracts_both(genec_main, tmp_path):
+    source = tmp_path / 'source.txt'
+    source.write_text('a 1\nb 2')
+    config = dict(REGEX_CONFIG, should_slice_clusters=True)
+    mock_extract, _ = run_main(genec_main, source, source, config)
+    assert mock_extract.call_count == 2
+
+
+def test_main_slices_source_and_reference_with_their_own_texts(genec_main, tmp_path):
+    source = tmp_path / 'source.txt'
+    source.write_text('skip 1\nSRC_START 2\nSRC_END 3\nskip 4')
+    reference = tmp_path / 'reference.txt'
+    reference.write_text('skip 5\nREF_START 6\nREF_END 7\nskip 8')
+    config = dict(REGEX_CONFIG, should_slice_clusters=True,
+                  src_start_cluster_text='SRC_START', src_end_cluster_text='SRC_END',
+                  ref_start_cluster_text='REF_START', ref_end_cluster_text='REF_END')
+    _, differences = run_main(genec_main, source, reference, config)
+    assert differences == {
+        '2': {'source': 1, 'reference': 0, 'difference': 1},
+        '3': {'source': 1, 'reference': 0, 'difference': 1},
+        '6': {'source': 0, 'reference': 1, 'difference': -1},
+        '7': {'source': 0, 'reference': 1, 'difference': -1}
+    }
@@ -0,0 +1,95 @@
+import locale
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from GenEC import utils
+
+LOCALE_ENCODING = locale.getpreferredencoding(False)
+
+
+def is_invalid_in_locale_encoding(data):
+    try:
+        data.decode(LOCALE_ENCODING)
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+@pytest.mark.parametrize('content, expected_result', [
+    (b'a\nb\n', 'a\nb\n'),
+    (b'a\r\nb\r\n', 'a\nb\n'),
+    (b'a\rb\r', 'a\nb\n'),
+    (b'a\r\nb\rc\n', 'a\nb\nc\n')])
+def test_read_file_newlines(tmp_path, content, expected_result):
+    file = tmp_path / 'file.txt'
+    file.write_bytes(content)
+    assert utils.read_file(file) == expected_result
+
+
+def test_read_file_locale_encoding(tmp_path):
+    file = tmp_path / 'file.txt'
+    file.write_bytes('café'.encode(LOCALE_ENCODING))
+    assert utils.read_file(file) == 'café'
+
+
+@pytest.mark.skipif(not is_invalid_in_locale_encoding(b'\x81'), reason='locale encoding accepts every byte')
+def test_read_file_invalid_bytes(tmp_path):
+    file = tmp_path / 'file.txt'
+    file.write_bytes(b'x\x811\n')  # 0x81 is invalid in both utf-8 and cp1252
+    with pytest.raises(UnicodeDecodeError):
+        utils.read_file(file)
+
+
+def test_read_file_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        utils.read_file(tmp_path / 'missing.txt')
+
+
+def test_read_files_keeps_input_order(tmp_path):
+    first = tmp_path / 'first.txt'
+    first.write_text('first')
+    second = tmp_path / 'second.txt'
+    second.write_text('second')
+    assert utils.read_files([second, first, second]) == ['second', 'first', 'second']
+
+
+@pytest.mark.parametrize('reference_kind', ['same_path', 'other_spelling', 'symlink', 'hardlink'])
+def test_read_files_same_file_read_once(tmp_path, same_file_path, reference_kind):
+    source = tmp_path / 'source.txt'
+    source.write_text('data')
+    reference = same_file_path(source, reference_kind)
+    with patch.object(utils, 'read_file', wraps=utils.read_file) as mock_read_file:
+        assert utils.read_files([source, reference]) == ['data', 'data']
+    mock_read_file.assert_called_once_with(source)
+
+
+def test_read_files_unknown_inode_reads_each_file(tmp_path):
+    source = tmp_path / 'source.txt'
+    source.write_text('source')
+    reference = tmp_path / 'reference.txt'
+    reference.write_text('reference')
+    with patch('os.stat', return_value=SimpleNamespace(st_dev=1, st_ino=0)):
+        assert utils.read_files([source, reference]) == ['source', 'reference']
+
+
+def test_read_files_file_not_found(tmp_path):
+    existing = tmp_path / 'existing.txt'
+    existing.write_text('data')
+    with pytest.raises(FileNotFoundError):
+        utils.read_files([existing, tmp_path / 'missing.txt'])
+
+
+@pytest.mark.parametrize('other_kind', ['same_path', 'other_spelling', 'symlink', 'hardlink'])
+def test_get_file_id_same_file(tmp_path, same_file_path, other_kind):
+    file = tmp_path / 'file.txt'
+    file.write_text('data')
+    assert utils.get_file_id(file) == utils.get_file_id(same_file_path(file, other_kind))
+
+
+def test_get_file_id_other_file(tmp_path):
+    file = tmp_path / 'file.txt'
+    file.write_text('data')
+    other = tmp_path / 'other.txt'
+    other.write_text('data')
+    assert utils.get_file_id(file) != utils.get_file_id(other)